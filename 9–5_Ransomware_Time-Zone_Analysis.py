@@ -1,26 +1,54 @@
 import requests
-import statistics
+from requests.adapters import HTTPAdapter
+import ijson
+import urllib3
 import sqlite3
-import os
-from datetime import datetime
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 
 # -----------------------------------------------------------------
 # CONFIG
 # -----------------------------------------------------------------
-API_URL = "https://api.ransomware.live/victims/2024"
-HEADERS = {"accept": "application/json"}
+API_BASE_URL = "https://api.ransomware.live/victims"
+API_YEARS = [2024]  # one feed per year; list several to fetch them concurrently
+MAX_FETCH_WORKERS = 8  # concurrent API requests / pooled HTTPS connections
+HEADERS = {"accept": "application/json", "Accept-Encoding": "gzip"}
 DB_NAME = "ransomware_data.db"  # SQLite database file
 
-# Potential UTC offsets to consider (from -12 to +12)
-POSSIBLE_OFFSETS = list(range(-12, 13))
+# Connection tuning: WAL + synchronous=NORMAL halves fsyncs per commit
+DB_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
+
+# SQL condition accepting only the API's timestamp layout, "YYYY-MM-DD HH:MM:SS" with
+# optional ".ffffff". strftime() on its own would also take 'now', Julian day numbers,
+# bare dates, etc., so values are checked with this before being converted.
+# The last clause rejects dates/times that don't exist (2024-02-30, 24:00:00): a
+# modifier makes SQLite normalize them, so they no longer round-trip unchanged.
+DISCOVERED_FORMAT_CHECK = (
+    "substr({col}, 1, 19) GLOB "
+    "'[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9] [0-9][0-9]:[0-9][0-9]:[0-9][0-9]' "
+    "AND (length({col}) = 19 OR (length({col}) BETWEEN 21 AND 26 "
+    "AND substr({col}, 20, 1) = '.' AND substr({col}, 21) NOT GLOB '*[^0-9]*')) "
+    "AND datetime(substr({col}, 1, 19), '+0 seconds') = substr({col}, 1, 19)"
+)
+
+# Potential UTC offsets to consider (from -12 to +12), kept as an array so the
+# argmax index in find_best_offset maps straight to an offset
+OFFSETS_ARR = np.arange(-12, 13, dtype=np.int8)
 
 # The "9–5 window" for local business hours
 START_HOUR = 9
 END_HOUR = 17
 
+# BUSINESS_HOURS_MASK[i, u] is 1 when UTC hour u lands in local 9–5 for OFFSETS_ARR[i].
+# Scoring every offset is then a single (24,) @ (24, 25) matmul instead of a Python loop.
+_LOCAL_HOURS = (np.arange(24)[None, :] + OFFSETS_ARR[:, None]) % 24
+BUSINESS_HOURS_MASK = ((_LOCAL_HOURS >= START_HOUR) & (_LOCAL_HOURS < END_HOUR)).astype(np.float64)
+
 # Dictionary of offsets → a list of possible countries/regions
 # We’ll just store some examples for demonstration purposes.
 OFFSET_COUNTRIES = {
@@ -51,159 +79,277 @@ OFFSET_COUNTRIES = {
     12:  ["Fiji", "New Zealand", "Tuvalu", "Marshall Islands"]
 }
 
-def create_db_and_table():
+# Same regions as a dense list indexed by offset + 12, avoiding a dict lookup per group
+OFFSET_COUNTRIES_LIST = [OFFSET_COUNTRIES[o] for o in range(-12, 13)]
+
+def apply_pragmas(conn):
+    """Apply the DB_PRAGMAS tuning settings to an open connection."""
+    for pragma in DB_PRAGMAS:
+        conn.execute(pragma)
+
+def open_db():
+    """Open the single autocommit connection shared by the whole pipeline."""
+    conn = sqlite3.connect(DB_NAME, isolation_level=None)
+    apply_pragmas(conn)
+    return conn
+
+def close_db(conn):
+    """Let SQLite refresh its query-planner statistics, then close the connection."""
+    conn.execute("PRAGMA optimize")
+    conn.close()
+
+def create_db_and_table(conn):
     """Initialize SQLite database for storing victim posts."""
-    conn = sqlite3.connect(DB_NAME)
     cursor = conn.cursor()
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS victims (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             group_name TEXT NOT NULL,
             discovered TEXT NOT NULL,
+            hour_utc INTEGER NOT NULL,
+            weekday INTEGER NOT NULL,
             UNIQUE(group_name, discovered)
         )
     """)
-    conn.commit()
-    conn.close()
 
-def fetch_data_from_api():
-    """
-    Fetch the 100 most recent victims from the Ransomware.live API.
-    Returns a list of dicts with 'group_name' and 'discovered'.
-    """
+    # Databases created before the cached hour_utc/weekday (0=Monday) columns existed:
+    # add and backfill them from the text column. One transaction, so an interrupted
+    # migration leaves the table untouched and is simply redone on the next run.
+    cursor.execute("BEGIN")
     try:
-        resp = requests.get(API_URL, headers=HEADERS)
-        resp.raise_for_status()
-        data = resp.json()
-    except requests.RequestException as e:
-        print(f"Error fetching data: {e}")
-        return []
-
-    valid_records = []
-    for item in data:
-        discovered = item.get("discovered")
-        group_name = item.get("group_name")
-        if discovered and group_name:
-            valid_records.append({"group_name": group_name, "discovered": discovered})
-    return valid_records
-
-def store_records_in_db(records):
-    """Insert new records into the DB; duplicates are ignored via 'INSERT OR IGNORE'."""
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    for r in records:
-        try:
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(victims)")}
+        if "hour_utc" not in columns:
+            cursor.execute("ALTER TABLE victims ADD COLUMN hour_utc INTEGER")
+            cursor.execute("ALTER TABLE victims ADD COLUMN weekday INTEGER")
+            valid = DISCOVERED_FORMAT_CHECK.format(col="discovered")
             cursor.execute(
-                "INSERT OR IGNORE INTO victims (group_name, discovered) VALUES (?, ?)",
-                (r["group_name"], r["discovered"])
+                f"UPDATE victims SET "
+                f"hour_utc = CASE WHEN {valid} THEN CAST(strftime('%H', substr(discovered, 1, 19)) AS INTEGER) END, "
+                f"weekday = CASE WHEN {valid} THEN (CAST(strftime('%w', substr(discovered, 1, 19)) AS INTEGER) + 6) % 7 END"
             )
-        except sqlite3.Error as e:
-            print(f"DB insert error: {e}")
-    conn.commit()
-    conn.close()
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
 
-def gather_all_data():
-    """Retrieve all stored data from the DB as a list of dicts."""
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    cursor.execute("SELECT group_name, discovered FROM victims")
-    rows = cursor.fetchall()
-    conn.close()
+    # Covering index so the analysis SELECT (ordered by group) never touches the table rows
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_victims_group_hour ON victims (group_name, hour_utc, weekday)")
+
+    # Small key/value table for the HTTP cache validators of the last API download
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+    """)
 
-    data = []
-    for group_name, discovered in rows:
-        data.append({"group_name": group_name, "discovered": discovered})
-    return data
+def get_api_urls():
+    """Return the feed URL for each year in API_YEARS."""
+    return [f"{API_BASE_URL}/{year}" for year in API_YEARS]
 
-def parse_utc_hour(discovered_str):
+def load_http_validators(conn, urls):
+    """
+    Return the ETag/Last-Modified saved from the last complete download of each URL,
+    as {url: {"etag": ..., "last_modified": ...}}. Stored in meta as "<field> <url>" keys.
+    """
+    validators = {url: {} for url in urls}
+    for key, value in conn.execute("SELECT key, value FROM meta"):
+        field, _, url = key.partition(" ")
+        if url in validators:
+            validators[url][field] = value
+    return validators
+
+def save_http_validators(conn, validators):
     """
-    Convert the discovered time string into:
-      (hour_in_utc, weekday_index)
-    weekday_index: 0=Monday, 6=Sunday
-    Accepts formats with or without microseconds.
+    Replace the stored ETag/Last-Modified of each URL in `validators`.
+    Doesn't commit: store_records_in_db calls it inside its insert transaction so the
+    validators are only saved together with the rows they describe.
+    """
+    for url, fields in validators.items():
+        conn.execute("DELETE FROM meta WHERE key IN (?, ?)", (f"etag {url}", f"last_modified {url}"))
+        conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            ((f"{field} {url}", value) for field, value in fields.items())
+        )
+
+def fetch_feed(session, url, validators):
     """
-    for fmt in ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S"):
-        try:
-            dt = datetime.strptime(discovered_str, fmt)
-            return dt.hour, dt.weekday()
-        except ValueError:
-            pass
-    # If neither format worked
-    return None, None
-
-def build_distribution(df):
+    Download and parse one feed URL into a list of (group_name, discovered) tuples.
+    `validators` (see load_http_validators) are sent as If-None-Match/If-Modified-Since;
+    on 304 nothing is returned. After a full download they are updated in place.
     """
-    Build a 24-bin histogram for each group to count how many posts happened at each UTC hour.
+    headers = dict(HEADERS)
+    if "etag" in validators:
+        headers["If-None-Match"] = validators["etag"]
+    if "last_modified" in validators:
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    records = []
+    try:
+        # Stream the body and parse items one at a time instead of resp.json()
+        with session.get(url, headers=headers, stream=True) as resp:
+            if resp.status_code == 304:
+                print(f"{url} unchanged since the last run; skipping download.")
+                return []
+            resp.raise_for_status()
+            resp.raw.decode_content = True
+            for item in ijson.items(resp.raw, "item"):
+                discovered = item.get("discovered")
+                group_name = item.get("group_name")
+                # Non-string values would fail to bind and roll back the whole batch
+                if isinstance(discovered, str) and isinstance(group_name, str) and discovered and group_name:
+                    records.append((group_name, discovered))
+
+            # Only remember the validators once the whole body has been consumed
+            validators.clear()
+            if "ETag" in resp.headers:
+                validators["etag"] = resp.headers["ETag"]
+            if "Last-Modified" in resp.headers:
+                validators["last_modified"] = resp.headers["Last-Modified"]
+    except requests.RequestException as e:
+        print(f"Error fetching data from {url}: {e}")
+        return []
+    except urllib3.exceptions.HTTPError as e:
+        # Reading resp.raw directly bypasses requests' wrapping of mid-body
+        # failures (IncompleteRead, ProtocolError, DecodeError, ...)
+        print(f"Error fetching data from {url}: {e}")
+        return []
+    except ijson.JSONError as e:
+        print(f"Error parsing data from {url}: {e}")
+        return []
+    return records
+
+def fetch_data_from_api(validators):
+    """
+    Fetch victims for every year in API_YEARS from the Ransomware.live API.
+    Years are fetched concurrently over a pooled session and every feed is buffered
+    in memory: returns one list of (group_name, discovered) tuples, so the DB write
+    transaction in store_records_in_db only opens once all downloads have finished.
+    `validators` maps each feed URL to its HTTP validators (see fetch_feed).
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_FETCH_WORKERS, pool_maxsize=MAX_FETCH_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    with session, ThreadPoolExecutor(MAX_FETCH_WORKERS) as executor:
+        futures = [
+            executor.submit(fetch_feed, session, url, feed_validators)
+            for url, feed_validators in validators.items()
+        ]
+        records = []
+        for future in as_completed(futures):
+            records.extend(future.result())
+    return records
+
+def store_records_in_db(conn, records, validators):
+    """
+    Insert (group_name, discovered) tuples into the DB; duplicates are ignored via 'INSERT OR IGNORE'.
+    The HTTP `validators`, as updated by fetch_data_from_api, are saved in the same
+    transaction, so a failed insert never marks a feed as seen.
+    Returns the number of rows actually inserted, or None if the transaction failed.
+    """
+    try:
+        # One transaction + executemany: a single fsync for the whole batch
+        conn.execute("BEGIN")
+        # hour_utc and weekday (0=Monday) are derived once here by SQLite. Rows not in
+        # the expected layout are filtered out by the WHERE; out-of-range values strftime
+        # can't convert violate NOT NULL and are skipped by OR IGNORE
+        cursor = conn.executemany(
+            "INSERT OR IGNORE INTO victims (group_name, discovered, hour_utc, weekday) "
+            "SELECT g, d, CAST(strftime('%H', substr(d, 1, 19)) AS INTEGER), "
+            "(CAST(strftime('%w', substr(d, 1, 19)) AS INTEGER) + 6) % 7 "
+            "FROM (SELECT ?1 AS g, ?2 AS d) WHERE " + DISCOVERED_FORMAT_CHECK.format(col="d"),
+            records
+        )
+        inserted = cursor.rowcount
+        save_http_validators(conn, validators)
+        conn.commit()
+        return inserted
+    except sqlite3.Error as e:
+        conn.rollback()
+        print(f"DB insert error: {e}")
+        return None
+    except BaseException:
+        # Anything raised by the records iterator must not leave BEGIN open
+        conn.rollback()
+        raise
+
+def gather_all_data(conn):
+    """Retrieve all stored data from the DB as a list of (group_name, hour_utc, weekday) tuples."""
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT group_name, hour_utc, weekday FROM victims "
+        "WHERE hour_utc IS NOT NULL ORDER BY group_name"
+    )
+    return cursor.fetchall()
+
+def build_distribution(group_names, hours, weekdays):
+    """
+    From parallel arrays of post group names, UTC hours and weekdays,
+    build a 24-bin histogram for each group to count how many posts happened at each UTC hour.
     Also track how many posts happen on weekdays vs. weekends.
-    Returns a dict keyed by group_name, storing 'hour_counts', 'weekday_posts', 'weekend_posts', 'total_posts'.
+    Returns a dict keyed by group_name, storing 'hour_counts', 'weekday_posts', 'weekend_posts', 'total_posts',
+    plus the stacked (G, 24) hour histogram whose rows follow the dict's group order.
     """
+    groups, group_idx = np.unique(group_names, return_inverse=True)
+
+    # Joint (group, bin) histograms in one pass each: bin index = group_idx * n_bins + value
+    all_hour_counts = np.bincount(group_idx * 24 + hours, minlength=len(groups) * 24).reshape(-1, 24)
+    all_weekday_counts = np.bincount(group_idx * 7 + weekdays, minlength=len(groups) * 7).reshape(-1, 7)
+
     dist_data = {}
-    for _, row in df.iterrows():
-        group = row["group_name"]
-        hour = row["HourUTC"]
-        wday = row["Weekday"]
-
-        if group not in dist_data:
-            dist_data[group] = {
-                "hour_counts": [0]*24,
-                "weekday_posts": 0,
-                "weekend_posts": 0,
-                "total_posts": 0
-            }
-        dist_data[group]["hour_counts"][int(hour)] += 1
-
-        if wday < 5:
-            dist_data[group]["weekday_posts"] += 1
-        else:
-            dist_data[group]["weekend_posts"] += 1
-
-        dist_data[group]["total_posts"] += 1
-    return dist_data
-
-def measure_fit_to_offset(hour_counts, offset):
+    for i, group in enumerate(groups):
+        hour_counts = all_hour_counts[i]
+        weekday_counts = all_weekday_counts[i]
+        dist_data[group] = {
+            "hour_counts": hour_counts,
+            "weekday_posts": int(weekday_counts[:5].sum()),
+            "weekend_posts": int(weekday_counts[5:].sum()),
+            "total_posts": int(hour_counts.sum())
+        }
+    return dist_data, all_hour_counts
+
+def measure_fit_to_offsets(hour_counts):
     """
-    For a given group's 24-hour distribution (hour_counts),
-    figure out how many posts land in 'local' 9–5 when offset from UTC.
+    For one or more 24-hour distributions (shape (..., 24)),
+    figure out the fraction of posts that land in 'local' 9–5 for every offset at once.
       local_hour = (utc_hour + offset) % 24
-    Returns a float score = fraction of total posts falling in 9–17 local time.
+    Returns an array of shape (..., 25) of scores, ordered like OFFSETS_ARR.
     """
-    total_posts = sum(hour_counts)
-    if total_posts == 0:
-        return 0.0
+    hour_counts = np.asarray(hour_counts, dtype=np.float64)
+    total_posts = hour_counts.sum(axis=-1, keepdims=True)
+    business_posts = hour_counts @ BUSINESS_HOURS_MASK.T
+    return np.divide(business_posts, total_posts,
+                     out=np.zeros_like(business_posts), where=total_posts > 0)
 
-    business_posts = 0
-    for utc_hour, count in enumerate(hour_counts):
-        local_hour = (utc_hour + offset) % 24
-        if START_HOUR <= local_hour < END_HOUR:
-            business_posts += count
-
-    return business_posts / total_posts
-
-def find_best_offset(dist_data):
+def find_best_offset(dist_data, all_hour_counts):
     """
     For each group, test every offset from -12 to +12, pick the one
     that yields the highest fraction of posts in the '9-5 local' window.
+    All groups are scored together with one matmul on the (G, 24) histogram
+    from build_distribution.
     """
-    results = []
-    for group, info in dist_data.items():
-        hour_counts = info["hour_counts"]
-        best_offset = None
-        best_score = -1.0
+    if not dist_data:
+        return []
 
-        for offset in POSSIBLE_OFFSETS:
-            score = measure_fit_to_offset(hour_counts, offset)
-            if score > best_score:
-                best_score = score
-                best_offset = offset
+    groups = list(dist_data)
+    scores = measure_fit_to_offsets(all_hour_counts)  # (G, 25)
+    best_idx = scores.argmax(axis=1)
+    best_offsets = OFFSETS_ARR[best_idx]
+    best_scores = scores[np.arange(len(groups)), best_idx]
 
+    results = []
+    for i, group in enumerate(groups):
+        info = dist_data[group]
         results.append({
             "group": group,
-            "best_offset": best_offset,
-            "best_score": best_score,
+            "best_offset": int(best_offsets[i]),
+            "best_score": float(best_scores[i]),
             "weekday_posts": info["weekday_posts"],
             "weekend_posts": info["weekend_posts"],
             "total_posts": info["total_posts"],
-            "hour_counts": hour_counts
+            "hour_counts": info["hour_counts"]
         })
 
     return results
@@ -211,46 +357,50 @@ def find_best_offset(dist_data):
 def get_top_countries_for_offset(offset, top_n=5):
     """
     Given a best offset, return up to 'top_n' possible countries/regions
-    from the OFFSET_COUNTRIES dictionary.
+    from the OFFSET_COUNTRIES table.
     """
-    if offset in OFFSET_COUNTRIES:
-        return OFFSET_COUNTRIES[offset][:top_n]
+    if -12 <= offset <= 12:
+        return OFFSET_COUNTRIES_LIST[offset + 12][:top_n]
     return ["Unknown offset"]
 
 def main():
     # 1. Initialize DB
-    create_db_and_table()
+    conn = open_db()
+    create_db_and_table(conn)
 
     # 2. Fetch new data
     print("Fetching recent victims from the Ransomware.live API...")
-    new_recs = fetch_data_from_api()
+    validators = load_http_validators(conn, get_api_urls())
+    new_recs = fetch_data_from_api(validators)
     print(f"Retrieved {len(new_recs)} new records from the API.")
 
     # 3. Insert into DB
-    store_records_in_db(new_recs)
+    inserted = store_records_in_db(conn, new_recs, validators)
+    if inserted is not None:
+        print(f"Stored {inserted} new records from the API.")
 
     # 4. Gather all data
-    all_data = gather_all_data()
+    all_data = gather_all_data(conn)
+    close_db(conn)
     print(f"Total records in DB: {len(all_data)}")
 
     if not all_data:
         print("No data to analyze—exiting.")
         return
 
-    # 5. Convert to DataFrame
-    df_all = pd.DataFrame(all_data)
-
-    # Parse the discovered times into (hour_utc, weekday)
-    df_all["HourUTC"], df_all["Weekday"] = zip(*df_all["discovered"].apply(parse_utc_hour))
+    # 5. Convert to parallel NumPy arrays
+    group_names = np.array([row[0] for row in all_data], dtype=object)
 
-    # Drop rows where we couldn't parse hour
-    df_all.dropna(subset=["HourUTC"], inplace=True)
+    # hour_utc/weekday were computed once at insert time, so no timestamp parsing here;
+    # rows SQLite couldn't parse were already filtered out by gather_all_data
+    hours = np.fromiter((row[1] for row in all_data), dtype=np.int64, count=len(all_data))
+    weekdays = np.fromiter((row[2] for row in all_data), dtype=np.int64, count=len(all_data))
 
     # 6. Build hour distributions for each group
-    dist_data = build_distribution(df_all)
+    dist_data, all_hour_counts = build_distribution(group_names, hours, weekdays)
 
     # 7. Identify best offset/time zone
-    results = find_best_offset(dist_data)
+    results = find_best_offset(dist_data, all_hour_counts)
 
     # 8. Print final results
     print("\n--- Analysis Results ---\n")
@@ -274,7 +424,8 @@ def main():
         print()
 
     # (Optional) If you want advanced charts, day-of-week heatmaps, or more, you can implement them here.
-    # e.g., show a distribution chart for each group, etc.
+    # e.g., show a distribution chart for each group, etc. Import matplotlib/seaborn inside that
+    # code rather than at module level so runs without charts don't pay their startup cost.
 
 
 if __name__ == "__main__":
@@ -1,17 +1,43 @@
+import functools
 import requests
-import statistics
+from requests.adapters import HTTPAdapter
+import ijson
+import urllib3
 import sqlite3
-import os
-from datetime import datetime
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+import numpy as np
 
 # -----------------------------------------------------------------
 # CONFIG
 # -----------------------------------------------------------------
-API_URL = "https://api.ransomware.live/victims/2025"  # Example for 2024 data
-HEADERS = {"accept": "application/json"}
+API_BASE_URL = "https://api.ransomware.live/victims"
+API_YEARS = [2025]  # one feed per year; list several to fetch them concurrently
+MAX_FETCH_WORKERS = 8  # concurrent API requests / pooled HTTPS connections
+HEADERS = {"accept": "application/json", "Accept-Encoding": "gzip"}
 DB_NAME = "ransomware_data.db"  # SQLite database file
 
+# Connection tuning: WAL + synchronous=NORMAL halves fsyncs per commit
+DB_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
+
+# SQL condition accepting only the API's timestamp layout, "YYYY-MM-DD HH:MM:SS" with
+# optional ".ffffff". strftime() on its own would also take 'now', Julian day numbers,
+# bare dates, etc., so values are checked with this before being converted.
+# The last clause rejects dates/times that don't exist (2024-02-30, 24:00:00): a
+# modifier makes SQLite normalize them, so they no longer round-trip unchanged.
+DISCOVERED_FORMAT_CHECK = (
+    "substr({col}, 1, 19) GLOB "
+    "'[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9] [0-9][0-9]:[0-9][0-9]:[0-9][0-9]' "
+    "AND (length({col}) = 19 OR (length({col}) BETWEEN 21 AND 26 "
+    "AND substr({col}, 20, 1) = '.' AND substr({col}, 21) NOT GLOB '*[^0-9]*')) "
+    "AND datetime(substr({col}, 1, 19), '+0 seconds') = substr({col}, 1, 19)"
+)
+
 # The "9–5 window" for local business hours
 START_HOUR = 9
 END_HOUR = 17
@@ -45,6 +71,18 @@ OFFSET_COUNTRIES = {
     12:  ["Fiji", "New Zealand", "Tuvalu", "Marshall Islands"]
 }
 
+# Same regions as a dense list indexed by offset + 12, avoiding a dict lookup per group
+OFFSET_COUNTRIES_LIST = [OFFSET_COUNTRIES[o] for o in range(-12, 13)]
+
+# Offsets scored by find_best_offset (–12..+12), kept as an array so the
+# argmax index maps straight to an offset
+OFFSETS_ARR = np.arange(-12, 13, dtype=np.int8)
+
+# BUSINESS_HOURS_MASK[i, u] is 1 when UTC hour u lands in local 9–5 for OFFSETS_ARR[i].
+# Scoring every offset is then a single (24,) @ (24, 25) matmul instead of a Python loop.
+_LOCAL_HOURS = (np.arange(24)[None, :] + OFFSETS_ARR[:, None]) % 24
+BUSINESS_HOURS_MASK = ((_LOCAL_HOURS >= START_HOUR) & (_LOCAL_HOURS < END_HOUR)).astype(np.float64)
+
 # Example holiday/festive dates (partial, simplified). 
 # Real 2024 approximations for demonstration:
 HOLIDAYS = {
@@ -66,90 +104,251 @@ HOLIDAYS = {
     # Etc. for other regions if desired
 }
 
+# HOLIDAYS with the date strings parsed once at load time
+HOLIDAYS_PARSED = {
+    region: [(date.fromisoformat(start), date.fromisoformat(end)) for start, end in ranges]
+    for region, ranges in HOLIDAYS.items()
+}
+
+
+def _build_holiday_ranges(holidays_parsed):
+    """
+    Per-region (starts, ends) as sorted datetime64[D] arrays for holiday_mask.
+    Overlapping or touching ranges are merged, since the lookup only checks the
+    last range starting on or before each date.
+    """
+    holiday_ranges = {}
+    for region, ranges in holidays_parsed.items():
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + timedelta(days=1):
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        holiday_ranges[region] = (
+            np.array([start for start, _ in merged], dtype="datetime64[D]"),
+            np.array([end for _, end in merged], dtype="datetime64[D]"),
+        )
+    return holiday_ranges
+
+
+HOLIDAY_RANGES = _build_holiday_ranges(HOLIDAYS_PARSED)
+
 # For a simple religious pattern guess (Sunday vs Friday)
 JUDEO_CHRISTIAN_NON_WORK_DAYS = {6}  # Sunday is index 6
 ISLAMIC_NON_WORK_DAYS = {4}         # Friday is index 4
 
 
-def create_db_and_table():
+def apply_pragmas(conn):
+    """Apply the DB_PRAGMAS tuning settings to an open connection."""
+    for pragma in DB_PRAGMAS:
+        conn.execute(pragma)
+
+
+def open_db():
+    """Open the single autocommit connection shared by the whole pipeline."""
+    conn = sqlite3.connect(DB_NAME, isolation_level=None)
+    apply_pragmas(conn)
+    return conn
+
+
+def close_db(conn):
+    """Let SQLite refresh its query-planner statistics, then close the connection."""
+    conn.execute("PRAGMA optimize")
+    conn.close()
+
+
+def create_db_and_table(conn):
     """Initialize SQLite database for storing victim posts."""
-    conn = sqlite3.connect(DB_NAME)
     cursor = conn.cursor()
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS victims (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             group_name TEXT NOT NULL,
             discovered TEXT NOT NULL,
+            hour_utc INTEGER NOT NULL,
+            weekday INTEGER NOT NULL,
             UNIQUE(group_name, discovered)
         )
     """)
-    conn.commit()
-    conn.close()
 
-
-def fetch_data_from_api():
-    """Fetch data from the specified Ransomware.live endpoint."""
+    # Databases created before the cached hour_utc/weekday (0=Monday) columns existed:
+    # add and backfill them from the text column. One transaction, so an interrupted
+    # migration leaves the table untouched and is simply redone on the next run.
+    cursor.execute("BEGIN")
     try:
-        resp = requests.get(API_URL, headers=HEADERS)
-        resp.raise_for_status()
-        data = resp.json()
-    except requests.RequestException as e:
-        print(f"Error fetching data: {e}")
-        return []
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(victims)")}
+        if "hour_utc" not in columns:
+            cursor.execute("ALTER TABLE victims ADD COLUMN hour_utc INTEGER")
+            cursor.execute("ALTER TABLE victims ADD COLUMN weekday INTEGER")
+            valid = DISCOVERED_FORMAT_CHECK.format(col="discovered")
+            cursor.execute(
+                f"UPDATE victims SET "
+                f"hour_utc = CASE WHEN {valid} THEN CAST(strftime('%H', substr(discovered, 1, 19)) AS INTEGER) END, "
+                f"weekday = CASE WHEN {valid} THEN (CAST(strftime('%w', substr(discovered, 1, 19)) AS INTEGER) + 6) % 7 END"
+            )
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+    # Covering index so the analysis SELECT (ordered by group) never touches the table rows
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_victims_group_hour ON victims (group_name, hour_utc, weekday)")
 
-    valid_records = []
-    for item in data:
-        discovered = item.get("discovered")
-        group_name = item.get("group_name")
-        if discovered and group_name:
-            valid_records.append({"group_name": group_name, "discovered": discovered})
-    return valid_records
+    # Small key/value table for the HTTP cache validators of the last API download
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+    """)
 
 
-def store_records_in_db(records):
-    """Insert new records into the DB; duplicates are ignored."""
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    for r in records:
-        try:
-            cursor.execute(
-                "INSERT OR IGNORE INTO victims (group_name, discovered) VALUES (?, ?)",
-                (r["group_name"], r["discovered"])
-            )
-        except sqlite3.Error as e:
-            print(f"DB insert error: {e}")
-    conn.commit()
-    conn.close()
+def get_api_urls():
+    """Return the feed URL for each year in API_YEARS."""
+    return [f"{API_BASE_URL}/{year}" for year in API_YEARS]
 
 
-def gather_all_data():
-    """Retrieve all stored data from the DB."""
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    cursor.execute("SELECT group_name, discovered FROM victims")
-    rows = cursor.fetchall()
-    conn.close()
+def load_http_validators(conn, urls):
+    """
+    Return the ETag/Last-Modified saved from the last complete download of each URL,
+    as {url: {"etag": ..., "last_modified": ...}}. Stored in meta as "<field> <url>" keys.
+    """
+    validators = {url: {} for url in urls}
+    for key, value in conn.execute("SELECT key, value FROM meta"):
+        field, _, url = key.partition(" ")
+        if url in validators:
+            validators[url][field] = value
+    return validators
+
+
+def save_http_validators(conn, validators):
+    """
+    Replace the stored ETag/Last-Modified of each URL in `validators`.
+    Doesn't commit: store_records_in_db calls it inside its insert transaction so the
+    validators are only saved together with the rows they describe.
+    """
+    for url, fields in validators.items():
+        conn.execute("DELETE FROM meta WHERE key IN (?, ?)", (f"etag {url}", f"last_modified {url}"))
+        conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            ((f"{field} {url}", value) for field, value in fields.items())
+        )
+
+
+def fetch_feed(session, url, validators):
+    """
+    Download and parse one feed URL, returning a list of (group_name, discovered) tuples.
+    Sends `validators` as a conditional request and returns [] on 304;
+    after a full download, updates `validators` in place.
+    """
+    headers = dict(HEADERS)
+    if "etag" in validators:
+        headers["If-None-Match"] = validators["etag"]
+    if "last_modified" in validators:
+        headers["If-Modified-Since"] = validators["last_modified"]
 
-    data = []
-    for group_name, discovered in rows:
-        data.append({"group_name": group_name, "discovered": discovered})
-    return data
+    records = []
+    try:
+        # Stream the body and parse items one at a time instead of resp.json()
+        with session.get(url, headers=headers, stream=True) as resp:
+            if resp.status_code == 304:
+                print(f"{url} unchanged since the last run; skipping download.")
+                return []
+            resp.raise_for_status()
+            resp.raw.decode_content = True
+            for item in ijson.items(resp.raw, "item"):
+                discovered = item.get("discovered")
+                group_name = item.get("group_name")
+                # Non-string values would fail to bind and roll back the whole batch
+                if isinstance(discovered, str) and isinstance(group_name, str) and discovered and group_name:
+                    records.append((group_name, discovered))
+
+            # Only remember the validators once the whole body has been consumed
+            validators.clear()
+            if "ETag" in resp.headers:
+                validators["etag"] = resp.headers["ETag"]
+            if "Last-Modified" in resp.headers:
+                validators["last_modified"] = resp.headers["Last-Modified"]
+    except requests.RequestException as e:
+        print(f"Error fetching data from {url}: {e}")
+        return []
+    except urllib3.exceptions.HTTPError as e:
+        # Reading resp.raw directly bypasses requests' wrapping of mid-body
+        # failures (IncompleteRead, ProtocolError, DecodeError, ...)
+        print(f"Error fetching data from {url}: {e}")
+        return []
+    except ijson.JSONError as e:
+        print(f"Error parsing data from {url}: {e}")
+        return []
+    return records
 
 
-def parse_timestamp(discovered_str):
+def fetch_data_from_api(validators):
+    """
+    Fetch victims for every year in API_YEARS from the Ransomware.live API.
+    Years are fetched concurrently over a pooled session and every feed is buffered
+    in memory: returns one list of (group_name, discovered) tuples, so the DB write
+    transaction in store_records_in_db only opens once all downloads have finished.
+    `validators` maps each feed URL to its HTTP validators (see fetch_feed).
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_FETCH_WORKERS, pool_maxsize=MAX_FETCH_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    with session, ThreadPoolExecutor(MAX_FETCH_WORKERS) as executor:
+        futures = [
+            executor.submit(fetch_feed, session, url, feed_validators)
+            for url, feed_validators in validators.items()
+        ]
+        records = []
+        for future in as_completed(futures):
+            records.extend(future.result())
+    return records
+
+
+def store_records_in_db(conn, records, validators):
     """
-    Convert the discovered time string into:
-      (dt (datetime), hour_in_utc, weekday)
-    weekday: 0=Monday, ..., 6=Sunday
-    Accepts formats with or without microseconds.
+    Insert (group_name, discovered) tuples into the DB; duplicates are ignored.
+    `validators` (as updated by fetch_data_from_api) are saved in the same transaction.
+    Returns the number of rows actually inserted, or None if the transaction failed.
     """
-    for fmt in ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S"):
-        try:
-            dt = datetime.strptime(discovered_str, fmt)
-            return dt, dt.hour, dt.weekday()
-        except ValueError:
-            pass
-    return None, None, None
+    try:
+        # One transaction + executemany: a single fsync for the whole batch
+        conn.execute("BEGIN")
+        # hour_utc and weekday (0=Monday) are derived once here by SQLite. Rows not in
+        # the expected layout are filtered out by the WHERE; out-of-range values strftime
+        # can't convert violate NOT NULL and are skipped by OR IGNORE
+        cursor = conn.executemany(
+            "INSERT OR IGNORE INTO victims (group_name, discovered, hour_utc, weekday) "
+            "SELECT g, d, CAST(strftime('%H', substr(d, 1, 19)) AS INTEGER), "
+            "(CAST(strftime('%w', substr(d, 1, 19)) AS INTEGER) + 6) % 7 "
+            "FROM (SELECT ?1 AS g, ?2 AS d) WHERE " + DISCOVERED_FORMAT_CHECK.format(col="d"),
+            records
+        )
+        inserted = cursor.rowcount
+        save_http_validators(conn, validators)
+        conn.commit()
+        return inserted
+    except sqlite3.Error as e:
+        conn.rollback()
+        print(f"DB insert error: {e}")
+        return None
+    except BaseException:
+        # Anything raised by the records iterator must not leave BEGIN open
+        conn.rollback()
+        raise
+
+
+def gather_all_data(conn):
+    """Retrieve all stored posts from the DB as (group_name, hour_utc, weekday) tuples."""
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT group_name, hour_utc, weekday FROM victims "
+        "WHERE hour_utc IS NOT NULL ORDER BY group_name"
+    )
+    return cursor.fetchall()
 
 
 def in_holiday_period(dt, region):
@@ -157,91 +356,99 @@ def in_holiday_period(dt, region):
     Checks if the datetime `dt` falls within a known holiday range for the given region.
     Only compares the date portion (yyyy-mm-dd).
     """
-    if region not in HOLIDAYS:
-        return False
-
-    for start_str, end_str in HOLIDAYS[region]:
-        try:
-            start_dt = datetime.strptime(start_str, "%Y-%m-%d")
-            end_dt = datetime.strptime(end_str, "%Y-%m-%d")
-            if start_dt.date() <= dt.date() <= end_dt.date():
-                return True
-        except ValueError:
-            continue
+    return _date_in_holiday(dt.date(), region)
+
+
+@functools.lru_cache(maxsize=None)
+def _date_in_holiday(day, region):
+    """Cached worker for in_holiday_period; many posts share the same day."""
+    for start, end in HOLIDAYS_PARSED.get(region, ()):
+        if start <= day <= end:
+            return True
     return False
 
 
-def build_distribution(df):
+def holiday_mask(dates, region):
+    """
+    Vectorized in_holiday_period: returns a boolean array marking which of `dates`
+    (anything convertible to datetime64[D], e.g. a group's post dates) fall within
+    a known holiday range for the given region.
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    starts, ends = HOLIDAY_RANGES.get(region, (None, None))
+    if starts is None or starts.size == 0:
+        return np.zeros(dates.shape, dtype=bool)
+
+    # Index of the last range starting on or before each date, or -1 if none
+    idx = np.searchsorted(starts, dates, side="right") - 1
+    return (idx >= 0) & (dates <= ends[np.clip(idx, 0, None)])
+
+
+def build_distribution(group_names, hours, weekdays):
     """
-    Build a distribution for each group with:
+    From parallel arrays of post group names, UTC hours and weekdays,
+    build a distribution for each group with:
       - hour_counts: [count for UTC hour 0..23]
       - weekday_counts: [count for Monday..Sunday]
       - total_posts
+    Also returns the stacked (G, 24) hour histogram, rows in the dict's group order.
     """
-    dist_data = {}
-    for _, row in df.iterrows():
-        group = row["group_name"]
-        dt_obj = row["dt_obj"]      # the datetime
-        hour_utc = row["HourUTC"]
-        wday = row["Weekday"]
-
-        if group not in dist_data:
-            dist_data[group] = {
-                "hour_counts": [0]*24,
-                "weekday_counts": [0]*7,
-                "total_posts": 0
-            }
+    groups, group_idx = np.unique(group_names, return_inverse=True)
 
-        if hour_utc is not None:
-            dist_data[group]["hour_counts"][hour_utc] += 1
-        if wday is not None:
-            dist_data[group]["weekday_counts"][wday] += 1
+    # Joint (group, bin) histograms in one pass each: bin index = group_idx * n_bins + value
+    all_hour_counts = np.bincount(group_idx * 24 + hours, minlength=len(groups) * 24).reshape(-1, 24)
+    all_weekday_counts = np.bincount(group_idx * 7 + weekdays, minlength=len(groups) * 7).reshape(-1, 7)
 
-        dist_data[group]["total_posts"] += 1
+    dist_data = {}
+    for i, group in enumerate(groups):
+        hour_counts = all_hour_counts[i]
+        weekday_counts = all_weekday_counts[i]
+        dist_data[group] = {
+            "hour_counts": hour_counts,
+            "weekday_counts": weekday_counts,
+            "total_posts": int(hour_counts.sum())
+        }
 
-    return dist_data
+    return dist_data, all_hour_counts
 
 
-def measure_fit_to_offset(hour_counts, offset):
+def measure_fit_to_offsets(hour_counts):
     """
-    For a group's 24-hour distribution, measure how many posts fall in local 9–5
-    with local_hour = (utc_hour + offset) % 24.
-    Returns fraction of total posts in that local 9-17 window.
+    For one or more 24-hour distributions (shape (..., 24)), measure the fraction of
+    posts falling in local 9–5 for every offset at once, where
+    local_hour = (utc_hour + offset) % 24.
+    Returns an array of shape (..., 25), ordered like OFFSETS_ARR.
     """
-    total_posts = sum(hour_counts)
-    if total_posts == 0:
-        return 0.0
-
-    business_posts = 0
-    for utc_hour, count in enumerate(hour_counts):
-        local_hour = (utc_hour + offset) % 24
-        if START_HOUR <= local_hour < END_HOUR:
-            business_posts += count
+    hour_counts = np.asarray(hour_counts, dtype=np.float64)
+    total_posts = hour_counts.sum(axis=-1, keepdims=True)
+    business_posts = hour_counts @ BUSINESS_HOURS_MASK.T
+    return np.divide(business_posts, total_posts,
+                     out=np.zeros_like(business_posts), where=total_posts > 0)
 
-    return business_posts / total_posts
 
-
-def find_best_offset(dist_data):
+def find_best_offset(dist_data, all_hour_counts):
     """
     For each group, test every offset from -12..+12
     and pick the one that yields the highest fraction of 9–5 local posts.
+    All groups are scored together with one matmul on the (G, 24) histogram
+    from build_distribution.
     """
-    results = []
-    for group, info in dist_data.items():
-        hour_counts = info["hour_counts"]
-        best_offset = None
-        best_score = -1.0
+    if not dist_data:
+        return []
 
-        for offset in OFFSET_COUNTRIES.keys():
-            score = measure_fit_to_offset(hour_counts, offset)
-            if score > best_score:
-                best_score = score
-                best_offset = offset
+    groups = list(dist_data)
+    scores = measure_fit_to_offsets(all_hour_counts)  # (G, 25)
+    best_idx = scores.argmax(axis=1)
+    best_offsets = OFFSETS_ARR[best_idx]
+    best_scores = scores[np.arange(len(groups)), best_idx]
 
+    results = []
+    for i, group in enumerate(groups):
+        info = dist_data[group]
         results.append({
             "group": group,
-            "best_offset": best_offset,
-            "best_score": best_score,
+            "best_offset": int(best_offsets[i]),
+            "best_score": float(best_scores[i]),
             "weekday_counts": info["weekday_counts"],
             "total_posts": info["total_posts"],
             "hour_counts": info["hour_counts"]
@@ -278,34 +485,39 @@ def guess_cultural_pattern(weekday_counts):
 
 def main():
     # 1. DB Setup
-    create_db_and_table()
+    conn = open_db()
+    create_db_and_table(conn)
 
     # 2. Fetch data
     print("Fetching victim data from the API...")
-    new_recs = fetch_data_from_api()
+    validators = load_http_validators(conn, get_api_urls())
+    new_recs = fetch_data_from_api(validators)
     print(f"Retrieved {len(new_recs)} records from the API.")
 
     # 3. Store records
-    store_records_in_db(new_recs)
+    inserted = store_records_in_db(conn, new_recs, validators)
+    if inserted is not None:
+        print(f"Stored {inserted} new records from the API.")
 
     # 4. Gather all data
-    all_data = gather_all_data()
+    all_data = gather_all_data(conn)
+    close_db(conn)
     print(f"Total records in DB: {len(all_data)}")
 
     if not all_data:
         print("No data to analyze.")
         return
 
-    # 5. Convert to DataFrame
-    df_all = pd.DataFrame(all_data)
-    df_all["dt_obj"], df_all["HourUTC"], df_all["Weekday"] = zip(*df_all["discovered"].apply(parse_timestamp))
-    df_all.dropna(subset=["HourUTC"], inplace=True)
+    # 5. Convert to parallel NumPy arrays
+    group_names = np.array([row[0] for row in all_data], dtype=object)
+    hours = np.fromiter((row[1] for row in all_data), dtype=np.int64, count=len(all_data))
+    weekdays = np.fromiter((row[2] for row in all_data), dtype=np.int64, count=len(all_data))
 
     # 6. Build distribution
-    dist_data = build_distribution(df_all)
+    dist_data, all_hour_counts = build_distribution(group_names, hours, weekdays)
 
     # 7. Identify best offsets
-    results = find_best_offset(dist_data)
+    results = find_best_offset(dist_data, all_hour_counts)
 
     # 8. Print results
     print("\n--- 9–5 + Holiday/Festive Analysis (Improved with Full Offsets) ---\n")
@@ -320,7 +532,7 @@ def main():
         pattern_guess = guess_cultural_pattern(wdays)
 
         # Retrieve plausible countries from the full dictionary
-        top_countries = OFFSET_COUNTRIES.get(offset, ["Unknown offset"])[:3]
+        top_countries = OFFSET_COUNTRIES_LIST[offset + 12][:3]
 
         print(f"Group: {group}")
         print(f"  Best Offset: UTC{offset:+d}  (9–5 Match Score: {score:.2f})")
@@ -330,7 +542,9 @@ def main():
         print()
 
     print("Note: For holiday checks, you'd run a second pass after determining region,")
-    print("using in_holiday_period(dt, region) on each post for that region.\n")
+    print("reading that group's post dates back from the DB (this analysis only keeps")
+    print("hour_utc/weekday), e.g. SELECT date(discovered) FROM victims WHERE group_name = ?,")
+    print("and passing them to holiday_mask(dates, region).\n")
 
 
 if __name__ == "__main__":